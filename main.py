@@ -1,151 +1,554 @@
-import simpy
-from typing import List, Optional
-import random, numpy.random as npr
-import matplotlib.pyplot as plt
+from functools import lru_cache
+from typing import List, Optional, Union
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the kernels below then run as plain Python
+    njit, prange = None, range
 
 DO_PRINT = False
+USE_JIT = njit is not None
+# Run batches on a GPU when cupy and numba.cuda find one, see gpu_available
+USE_GPU = True
+cuda = None  # numba.cuda, imported by gpu_step on first use
+
+SPEED_LIMIT = 15
+BUMP_SLOW_DOWN = 5
+
+# int16 holds any position on the standard road: its length plus one tick at top
+# speed. run_batch widens positions and speeds for longer roads.
+SPEED_VALUES = np.array([10, 15, 20, 25, 30], dtype=np.int16)
+SPEED_WEIGHTS = np.array([1, 3, 5, 3, 1]) / 13
+FUMES_VALUES = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+FUMES_WEIGHTS = np.array([0.05, 0.1, 0.1, 0.15, 0.2, 0.15, 0.1, 0.1, 0.05])
+
+# Uniform random streams, one per stochastic road object (last axis of ``rand``).
+# The camera comes last: it only needs a coin flip per car, so the numba kernel
+# takes those as bits and its ``rand`` holds just the streams before it, one
+# row per stream so each is read contiguously.
+CONGESTION, COLLISION, CAMERA = range(3)
+
+# Road objects as the numba kernel sees them: a type tag and one parameter
+SPEED_CAMERA, SPEED_BUMP, CONGESTION_CHARGING, COLLISION_DETECTION = range(4)
+OBJECT_DTYPE = np.dtype([("tag", "i1"), ("param", "f4")])
+# Each GPU thread block covers this many runs by this many cars
+GPU_BLOCK = 32
+
+
+def make_rng(seed=None):
+    """Create the Generator a batch draws all of its randomness from."""
+    return np.random.Generator(np.random.PCG64DXSM(seed))
+
+
+def car_ids(mask):
+    """Ids of the cars selected by ``mask``, counting from 1 within each run."""
+    return np.nonzero(mask)[-1] + 1
 
 
 class RoadObject:
     """Base class for objects on the road (speed bumps, cameras, etc)."""
 
-    def affect(self, car, env):
+    # Type tag for Road.object_table; None if the kernel has no implementation
+    TAG: Optional[int] = None
+    # Whether affect draws on ``rand``; assume so unless a subclass says not
+    stochastic = True
+
+    @property
+    def param(self):
+        """The parameter stored alongside ``TAG`` in the object table."""
+        return 0.0
+
+    @property
+    def is_active(self):
+        """Whether this object can affect any car; inactive ones are skipped."""
+        return True
+
+    def affect(self, speeds, mask, rand):
+        """Update ``speeds`` of the cars in ``mask`` using this tick's ``rand``."""
         pass
 
+    def source(self, bind):
+        """Return ``affect`` as inline code for ``Road``'s generated step.
+
+        ``bind`` turns a parameter into an expression the code can use. The
+        default just calls ``affect``, so any object can take part.
+        """
+        return f"{bind(self)}.affect(speeds, mask, rand)"
+
+    def kernel_source(self, param):
+        """Return ``affect`` for car ``i`` as code for ``Road.kernel``.
+
+        The code updates ``speed`` given ``moving``, ``rand[:, i]`` and ``flips[i]``;
+        ``param`` names this object's parameter. Only tagged objects need it.
+        """
+        raise NotImplementedError
+
 
 class SpeedCamera(RoadObject):
+    TAG = SPEED_CAMERA
+
     def __init__(self, speed_limit):
         self.speed_limit = speed_limit
 
-    def affect(self, car, env):
-        if random.choice([True, False]):
-            car.speed = max(
-                car.speed - 5, 1
-            )  # 50% chance to slow down before speed check
-        if car.speed > self.speed_limit:
-            if DO_PRINT:
-                print(f"Car {car.id} fined for speeding at {env.now}s!")
+    @property
+    def param(self):
+        return self.speed_limit
+
+    def affect(self, speeds, mask, rand):
+        # 50% chance to slow down before speed check
+        slow = mask & (rand[..., CAMERA] < 0.5)
+        # max(speed - 5, 1) for slowed cars; max(speed, 0) leaves the rest alone
+        speeds -= 5 * slow
+        np.maximum(speeds, slow, out=speeds)
+        if DO_PRINT:
+            for car_id in car_ids(mask & (speeds > self.speed_limit)):
+                print(f"Car {car_id} fined for speeding!")
+
+    def source(self, bind):
+        return (
+            f"slow = mask & (rand[..., {CAMERA}] < 0.5)\n"
+            "speeds -= 5 * slow\n"
+            "np.maximum(speeds, slow, out=speeds)"
+        )
+
+    def kernel_source(self, param):
+        return "slow = moving & flips[i]\nspeed = max(speed - 5 * slow, slow)"
 
 
 class SpeedBump(RoadObject):
-    def __init__(self, slow_down):
-        self.slow_down = slow_down
+    TAG = SPEED_BUMP
+    stochastic = False
 
-    def affect(self, car, env):
-        car.speed = max(car.speed - self.slow_down, 1)
+    def __init__(self, slow_down):
+        # Speeds are integers; every path would round a fractional bump differently
+        if slow_down != int(slow_down):
+            raise ValueError(f"slow_down must be a whole number, got {slow_down!r}")
+        self.slow_down = int(slow_down)
+
+    @property
+    def param(self):
+        return self.slow_down
+
+    def affect(self, speeds, mask, rand):
+        speeds -= self.slow_down * mask
+        np.maximum(speeds, mask, out=speeds)
         if DO_PRINT:
-            print(
-                f"Car {car.id} slowed to {car.speed} at {env.now}s due to speed bump."
-            )
+            for car_id, speed in zip(car_ids(mask), speeds[mask]):
+                print(f"Car {car_id} slowed to {speed} due to speed bump.")
+
+    def source(self, bind):
+        slow_down = bind(self.slow_down)
+        return f"speeds -= {slow_down} * mask\nnp.maximum(speeds, mask, out=speeds)"
+
+    def kernel_source(self, param):
+        return f"speed = max(speed - int({param}) * moving, moving)"
 
 
 class CongestionCharging(RoadObject):
-    def __init__(self, fumes: float):
+    TAG = CONGESTION_CHARGING
+
+    def __init__(self, fumes: Union[float, np.ndarray]):
+        # A batch of runs passes one fumes level per run, shaped (num_runs, 1)
         self.fumes = fumes
+        self.charging = np.asarray(fumes) > 0.5
 
-    def affect(self, car, env):
-        if self.fumes > 0.5:
-            if bool(
-                npr.choice([True, False], 1, p=[0.4, 0.6])[0]
-            ):  # 60% chance of aborting and not going through congestion zone
-                if DO_PRINT:
-                    print(f"Car is being charged for entering")
-            else:
-                car.speed = 0
+    @property
+    def param(self):
+        return self.fumes
+
+    @property
+    def is_active(self):
+        return bool(self.charging.any())
+
+    def affect(self, speeds, mask, rand):
+        mask = mask & self.charging
+        # 60% chance of aborting and not going through congestion zone
+        charged = rand[..., CONGESTION] < 0.4
+        if DO_PRINT:
+            for _ in car_ids(mask & charged):
+                print(f"Car is being charged for entering")
+        speeds *= ~(mask & ~charged)
+
+    def source(self, bind):
+        charging = bind(self.charging)
+        return f"speeds *= ~(mask & {charging} & (rand[..., {CONGESTION}] >= 0.4))"
+
+    def kernel_source(self, param):
+        return (
+            f"speed *= 1 - (moving & ({param} > 0.5) & (rand[{CONGESTION}, i] >= 0.4))"
+        )
 
 
 class TrafficCollisionDetection(RoadObject):
+    TAG = COLLISION_DETECTION
+
     def __init__(self): ...
 
-    def affect(self, car, env):
+    def affect(self, speeds, mask, rand):
         # Simulate a collision detection system
-        if bool(npr.choice([True, False], 1, p=[0.05, 0.95])[0]):
-            if DO_PRINT:
-                print(f"Collision detected for Car {car.id} at {env.now}s!")
-            car.speed = 0  # Stop the car in case of collision
-
+        collided = mask & (rand[..., COLLISION] < 0.05)
+        if DO_PRINT:
+            for car_id in car_ids(collided):
+                print(f"Collision detected for Car {car_id}!")
+        speeds *= ~collided  # Stop the car in case of collision
 
-class Car:
-    def __init__(self, id, speed=10):
-        self.id = id
-        self.speed = speed
-        self.position = 0
+    def source(self, bind):
+        return f"speeds *= ~(mask & (rand[..., {COLLISION}] < 0.05))"
 
-    def move(self):
-        self.position += self.speed
+    def kernel_source(self, param):
+        return f"speed *= 1 - (moving & (rand[{COLLISION}, i] < 0.05))"
 
 
 class Road:
     def __init__(self, length, objects: Optional[List[RoadObject]] = None):
         self.length = length
         self.objects = objects if objects else []
-
-    def check_objects(self, car, env):
-        for obj in self.objects:
-            obj.affect(car, env)
-
-
-def car_process(env, car: Car, road: Road, finished_cars, time_limit):
-    while car.position < road.length and env.now < time_limit:
-        car.move()
-        if DO_PRINT:
-            print(
-                f"Car {car.id} at position {car.position} (speed {car.speed}) at {env.now}s"
-            )
-        road.check_objects(car, env)
-        yield env.timeout(1)
-    if car.position >= road.length and env.now <= time_limit:
-        if DO_PRINT:
-            print(f"Car {car.id} finished at {env.now}s!")
-        finished_cars.append(car.id)
-    elif car.position < road.length:
+        # Whether an object does anything is fixed once it is built
+        self.active_objects = [obj for obj in self.objects if obj.is_active]
+        # Debug output lives in each object's affect, so only fuse without it
+        self.step = self.check_objects if DO_PRINT else self._compile_step()
+
+    def check_objects(self, speeds, mask, rand):
+        for obj in self.active_objects:
+            obj.affect(speeds, mask, rand)
+
+    def _compile_step(self):
+        """Generate one function applying every object in order.
+
+        Scalar parameters are written into the code as literals and anything
+        else is bound as a global of the generated function, so a tick pays
+        for neither the per-object calls nor their attribute lookups.
+        """
+        namespace = {"np": np}
+
+        def bind(value):
+            if isinstance(value, (int, float)):
+                return repr(value)
+            name = f"_p{len(namespace)}"
+            namespace[name] = value
+            return name
+
+        lines = [
+            line
+            for obj in self.active_objects
+            for line in obj.source(bind).splitlines()
+        ]
+        body = "".join(f"    {line}\n" for line in lines) or "    pass\n"
+        code = compile(f"def step(speeds, mask, rand):\n{body}", "<road>", "exec")
+        exec(code, namespace)
+        return namespace["step"]
+
+    def kernel(self):
+        """Generate the numba kernel advancing one run by one tick.
+
+        It takes a run's row of ``object_table``, the tick's uniform draws as
+        ``(CAMERA, num_cars)`` and the camera's ``flips``, and returns how many
+        cars are still short of ``length``. Every object is applied inside a
+        single loop over the cars with no switch on the tags, so the loop
+        compiles to straight-line vector code. Each car's state is loaded before
+        anything is stored, which spares the loop checks for overlapping arrays.
+        The parameters come from the table, so roads with the same objects share
+        one compiled kernel.
+        """
+        params = "".join(
+            f"    p{k} = objects[{k}].param\n" for k in range(len(self.active_objects))
+        )
+        body = "".join(
+            f"        {line}\n"
+            for k, obj in enumerate(self.active_objects)
+            for line in obj.kernel_source(f"p{k}").splitlines()
+        )
+        return compile_kernel(
+            "def step(positions, speeds, length, objects, rand, flips):\n"
+            f"{params}"
+            "    remaining = 0\n"
+            "    for i in range(positions.size):\n"
+            "        position = positions[i]\n"
+            "        speed = speeds[i]\n"
+            "        moving = position < length\n"
+            "        position += speed * moving\n"
+            "        remaining += position < length\n"
+            "        positions[i] = position\n"
+            f"{body}"
+            "        speeds[i] = speed\n"
+            "    return remaining\n"
+        )
+
+    def object_table(self, num_runs):
+        """Describe the active objects as an ``OBJECT_DTYPE`` table for the kernel.
+
+        There is one row per run, since a parameter such as the fumes level can
+        differ between the runs of a batch.
+        """
+        table = np.empty((num_runs, len(self.active_objects)), dtype=OBJECT_DTYPE)
+        for k, obj in enumerate(self.active_objects):
+            if obj.TAG is None:
+                raise TypeError(f"{type(obj).__name__} has no kernel implementation")
+            table["tag"][:, k] = obj.TAG
+            table["param"][:, k] = np.ravel(obj.param)
+        return table
+
+
+def jit(**options):
+    """``numba.njit`` with ``options``, or a no-op when numba is unavailable."""
+    return njit(**options) if njit is not None else (lambda func: func)
+
+
+@lru_cache(maxsize=None)
+def compile_kernel(source):
+    """Compile a kernel generated by ``Road.kernel``, once per distinct source."""
+    namespace = {"np": np}
+    exec(compile(source, "<road kernel>", "exec"), namespace)
+    return jit(fastmath=True)(namespace["step"])
+
+
+@jit(cache=True)
+def draw_flips(flips):
+    """Fill ``flips`` with fair coin flips, unpacked from one 32-bit draw per 32.
+
+    Kept out of ``simulate_one``: inlined there, the unpacking loop slows the
+    whole tick down far more than it costs on its own.
+    """
+    n = flips.size
+    for start in range(0, n, 32):
+        word = np.random.randint(0, 2**32)
+        for i in range(start, min(start + 32, n)):
+            flips[i] = (word >> (i - start)) & 1
+
+
+# Not cached: these are compiled afresh for each kernel passed in
+@jit()
+def simulate_one(kernel, positions, speeds, length, objects, time_limit, seed):
+    """Run a single simulation with ``kernel``, drawing randoms from ``seed``."""
+    np.random.seed(seed)
+    n = positions.size
+    flips = np.empty(n, dtype=np.bool_)
+    for now in range(time_limit):
+        draw_flips(flips)
+        rand = np.random.random((CAMERA, n))
+        if kernel(positions, speeds, length, objects, rand, flips) == 0:
+            break
+
+
+@jit(parallel=True)
+def run_all(kernel, positions, speeds, length, objects, time_limit, seeds):
+    """Run every simulation in the batch, one per thread.
+
+    Runs share no state and each seeds its own stream, so the results do not
+    depend on how runs are spread over the threads.
+    """
+    for run in prange(positions.shape[0]):
+        simulate_one(
+            kernel,
+            positions[run],
+            speeds[run],
+            length,
+            objects[run],
+            time_limit,
+            seeds[run],
+        )
+
+
+@lru_cache(maxsize=None)
+def gpu_available():
+    """Whether cupy and numba.cuda are installed and can see a GPU.
+
+    Importing them and probing for a device is slow, so this waits until a
+    batch could use the GPU and then remembers the answer.
+    """
+    try:
+        import cupy  # noqa: F401
+        from numba import cuda
+    except ImportError:  # GPU support is optional and needs both packages
+        return False
+    return cuda.is_available()
+
+
+@lru_cache(maxsize=None)
+def gpu_step():
+    """Compile the tick kernel for the whole batch on the GPU, one thread per car.
+
+    The kernel takes ``(positions, speeds, length, tags, params, rand)`` for a
+    batch, where ``tags`` and ``params`` are the columns of
+    ``Road.object_table``.
+    """
+    # Bound at module level, where numba's CUDA simulator can swap it out
+    global cuda
+    from numba import cuda
+
+    @cuda.jit
+    def step_gpu(positions, speeds, length, tags, params, rand):
+        run, car = cuda.grid(2)
+        if run >= positions.shape[0] or car >= positions.shape[1]:
+            return
+        moving = positions[run, car] < length
+        positions[run, car] += speeds[run, car] * moving
+        speed = speeds[run, car]
+        for k in range(tags.shape[1]):
+            tag = tags[run, k]
+            if tag == SPEED_CAMERA:
+                slow = moving & (rand[run, car, CAMERA] < 0.5)
+                speed = max(speed - 5 * slow, slow)
+            elif tag == SPEED_BUMP:
+                speed = max(speed - int(params[run, k]) * moving, moving)
+            elif tag == CONGESTION_CHARGING:
+                charging = params[run, k] > 0.5
+                speed *= 1 - (moving & charging & (rand[run, car, CONGESTION] >= 0.4))
+            elif tag == COLLISION_DETECTION:
+                speed *= 1 - (moving & (rand[run, car, COLLISION] < 0.05))
+        speeds[run, car] = speed
+
+    return step_gpu
+
+
+def run_on_gpu(road, speeds, time_limit, rng):
+    """Run a batch on the GPU and return the number of cars finished per run.
+
+    The car arrays stay on the device for the whole batch and the uniforms are
+    drawn there by cupy, so only the final positions are copied back.
+    """
+    if speeds.size == 0:
+        # A launch needs at least one block along each axis of the grid
+        return np.zeros(speeds.shape[0], dtype=int)
+    import cupy as cp
+
+    step_gpu = gpu_step()
+    table = road.object_table(speeds.shape[0])
+    tags = cuda.to_device(np.ascontiguousarray(table["tag"]))
+    params = cuda.to_device(np.ascontiguousarray(table["param"]))
+    positions = cuda.to_device(np.zeros_like(speeds))
+    speeds = cuda.to_device(speeds)
+    rand = cp.random.default_rng(int(rng.integers(2**63))).random(
+        (time_limit, *speeds.shape, 3), dtype=cp.float32
+    )
+    blocks = tuple(-(-size // GPU_BLOCK) for size in speeds.shape)
+    for now in range(time_limit):
+        step_gpu[blocks, (GPU_BLOCK, GPU_BLOCK)](
+            positions, speeds, road.length, tags, params, rand[now]
+        )
+    return (positions.copy_to_host() >= road.length).sum(axis=1)
+
+
+def draw_randoms(rng, time_limit, shape):
+    """Draw every uniform a simulation of ``shape`` cars can use, up front.
+
+    Indexed as ``rand[now, ..., stream]``; float32 halves the memory traffic
+    and is plenty of resolution for the probabilities involved.
+    """
+    return rng.random((time_limit, *shape, 3), dtype=np.float32)
+
+
+def advance(road, positions, speeds, time_limit, rand=None):
+    """Move the cars along ``road`` for up to ``time_limit`` ticks, in place.
+
+    ``rand`` comes from ``draw_randoms`` and may be left out when none of the
+    road's active objects is stochastic.
+    """
+    # All cars advance in lockstep, one iteration per simulated second.
+    for now in range(time_limit):
+        moving = positions < road.length
+        if not moving.any():
+            break
+        positions[moving] += speeds[moving]
         if DO_PRINT:
-            print(f"Car {car.id} did not finish in time (stopped at {car.position})!")
-
-
-def run_simulation(num_cars=50, time_limit=30):
-    env = simpy.Environment()
-    road = Road(
-        length=100,
-        objects=[
-            SpeedCamera(15),
-            SpeedBump(5),
-            CongestionCharging(
-                float(
-                    npr.choice(
-                        [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9],
-                        1,
-                        p=[0.05, 0.1, 0.1, 0.15, 0.2, 0.15, 0.1, 0.1, 0.05],
-                    )[0]
-                )
-            ),
-            TrafficCollisionDetection(),
-        ],
+            for car_id, position, speed in zip(
+                car_ids(moving), positions[moving], speeds[moving]
+            ):
+                print(f"Car {car_id} at position {position} (speed {speed}) at {now}s")
+        road.step(speeds, moving, None if rand is None else rand[now])
+
+
+def run_batch(num_runs, num_cars=50, time_limit=30, rng=None, road=None):
+    """Run ``num_runs`` independent simulations side by side.
+
+    Car state is held in ``(num_runs, num_cars)`` arrays so every tick advances
+    all runs at once. ``road`` defaults to the standard road with a random
+    fumes level per run. Returns the number of cars that finished in each run.
+    """
+    if rng is None:
+        rng = make_rng()
+    if road is None:
+        fumes = rng.choice(FUMES_VALUES, size=(num_runs, 1), p=FUMES_WEIGHTS)
+        road = Road(
+            length=100,
+            objects=[
+                SpeedCamera(SPEED_LIMIT),
+                SpeedBump(BUMP_SLOW_DOWN),
+                CongestionCharging(fumes),
+                TrafficCollisionDetection(),
+            ],
+        )
+    farthest = road.length + int(SPEED_VALUES.max())
+    dtype = np.promote_types(SPEED_VALUES.dtype, np.min_scalar_type(-farthest))
+    speeds = rng.choice(SPEED_VALUES, size=(num_runs, num_cars), p=SPEED_WEIGHTS)
+    speeds = speeds.astype(dtype, copy=False)
+    # The SimPy version's env.run(until=time_limit) stopped before it looked at
+    # a car again after its last move, so only crossings within the first
+    # time_limit - 1 moves count as finished.
+    moves = max(time_limit - 1, 0)
+    if not DO_PRINT and not any(obj.stochastic for obj in road.active_objects):
+        # Without randomness a car's trajectory depends only on its starting
+        # speed, so simulate one car per distinct speed and look the rest up.
+        lanes, lane_of = np.unique(speeds.ravel(), return_inverse=True)
+        positions = np.zeros_like(lanes)
+        advance(road, positions, lanes, moves)
+        finished = (positions >= road.length)[lane_of].reshape(speeds.shape)
+        return finished.sum(axis=1)
+    # The kernels only know the tagged objects; others need their own affect
+    kernel_ready = all(obj.TAG is not None for obj in road.active_objects)
+    if USE_GPU and kernel_ready and not DO_PRINT and gpu_available():
+        return run_on_gpu(road, speeds, moves, rng)
+    positions = np.zeros_like(speeds)
+    if USE_JIT and kernel_ready and not DO_PRINT:
+        streams = np.random.SeedSequence(rng.integers(2**63)).spawn(num_runs)
+        seeds = np.array(
+            [stream.generate_state(1)[0] for stream in streams], dtype=np.uint32
+        )
+        run_all(
+            road.kernel(),
+            positions,
+            speeds,
+            road.length,
+            road.object_table(num_runs),
+            moves,
+            seeds,
+        )
+        return (positions >= road.length).sum(axis=1)
+    advance(
+        road,
+        positions,
+        speeds,
+        moves,
+        draw_randoms(rng, moves, positions.shape),
     )
-    speeds = [
-        random.choices([10, 15, 20, 25, 30], weights=[1, 3, 5, 3, 1])[0]
-        for _ in range(num_cars)
-    ]
-    cars = [Car(id=i + 1, speed=speeds[i]) for i in range(num_cars)]
-    finished_cars = []
-    for car in cars:
-        env.process(car_process(env, car, road, finished_cars, time_limit))
-    env.run(until=time_limit)
-    return len(finished_cars)
+    finished = positions >= road.length
+    if DO_PRINT:
+        for car_id in car_ids(finished):
+            print(f"Car {car_id} finished!")
+        for car_id, position in zip(car_ids(~finished), positions[~finished]):
+            print(f"Car {car_id} did not finish in time (stopped at {position})!")
+    return finished.sum(axis=1)
+
+
+def run_simulation(num_cars=50, time_limit=30, rng=None):
+    return int(run_batch(1, num_cars=num_cars, time_limit=time_limit, rng=rng)[0])
 
 
 def main():
     num_runs = 1000
     num_cars = 100
     time_limit = 60
-    results = []
-    for _ in range(num_runs):
-        finished = run_simulation(num_cars=num_cars, time_limit=time_limit)
-        if finished <= 10:
-            continue
-        results.append(finished)
-
-    # Plot histogram of results
+    rng = make_rng()
+    finished = run_batch(num_runs, num_cars=num_cars, time_limit=time_limit, rng=rng)
+    results = finished[finished > 10]
+
+    # Plot histogram of results; matplotlib is slow to import, so only load it here
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     plt.hist(results, bins=20, color="skyblue", edgecolor="black")
     plt.title(f"Number of Cars Finished per Run ({num_runs} runs)")
     plt.xlabel("Cars Finished")
@@ -153,7 +556,7 @@ def main():
     plt.grid(True)
     plt.savefig("cars_finished_histogram.png")
 
-    avg_finished = sum(results) / len(results)
+    avg_finished = results.mean()
     print(
         f"\nAverage number of cars that finished in {time_limit} seconds over {num_runs} runs: {avg_finished:.2f} out of {num_cars} cars."
     )
@@ -0,0 +1,220 @@
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+# Run the GPU kernel on numba's CUDA simulator unless asked to use a real GPU;
+# this has to be set before numba is first imported.
+os.environ.setdefault("NUMBA_ENABLE_CUDASIM", "1")
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def no_gpu(monkeypatch):
+    """Keep run_batch off the GPU unless a test asks for it."""
+    monkeypatch.setattr(main, "USE_GPU", False)
+
+
+@pytest.fixture
+def fake_cupy(monkeypatch):
+    """Stand in for cupy with NumPy, enough for run_on_gpu on the simulator."""
+    cuda = pytest.importorskip("numba.cuda")
+    if not cuda.is_available():
+        pytest.skip("no GPU and NUMBA_ENABLE_CUDASIM is off")
+    cupy = types.ModuleType("cupy")
+    cupy.float32 = np.float32
+    cupy.random = types.SimpleNamespace(default_rng=np.random.default_rng)
+    monkeypatch.setitem(sys.modules, "cupy", cupy)
+    return cupy
+
+
+def simpy_finished(speed, length, slow_down, time_limit):
+    """Whether the SimPy version counted a car on a road with only a bump."""
+    position = 0
+    for now in range(time_limit):
+        if position >= length:
+            return True  # the process resumed at ``now`` and left its loop
+        position += speed
+        speed = max(speed - slow_down, 1)
+    # env.run(until=time_limit) never resumes the process after its last move
+    return False
+
+
+@pytest.mark.parametrize("path", ["fast", "numpy", "jit"])
+@pytest.mark.parametrize("time_limit", [0, 1, 2, 4, 5, 6, 12, 40])
+def test_finish_rule_matches_simpy(monkeypatch, path, time_limit):
+    if path == "jit" and main.njit is None:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(main, "USE_JIT", path == "jit")
+    if path != "fast":
+        # Treat the bump as random so run_batch takes its full tick loop
+        monkeypatch.setattr(main.SpeedBump, "stochastic", True)
+    road = main.Road(50, [main.SpeedBump(5)])
+
+    finished = main.run_batch(3, 40, time_limit, rng=main.make_rng(7), road=road)
+
+    # Given a road, run_batch's first draw is the starting speeds
+    speeds = main.make_rng(7).choice(
+        main.SPEED_VALUES, size=(3, 40), p=main.SPEED_WEIGHTS
+    )
+    expected = [
+        sum(simpy_finished(int(s), 50, 5, time_limit) for s in run) for run in speeds
+    ]
+    np.testing.assert_array_equal(finished, expected)
+
+
+@pytest.mark.parametrize("path", ["numpy", "jit"])
+def test_long_road_does_not_wrap_positions(monkeypatch, path):
+    if path == "jit" and main.njit is None:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(main, "USE_JIT", path == "jit")
+    monkeypatch.setattr(main.SpeedBump, "stochastic", True)
+    # Past int16's range once the last tick's speed is added
+    road = main.Road(32767, [main.SpeedBump(0)])
+
+    finished = main.run_batch(2, 10, 4000, rng=main.make_rng(0), road=road)
+
+    np.testing.assert_array_equal(finished, [10, 10])
+
+
+@pytest.mark.parametrize("path", ["numpy", "jit"])
+def test_empty_batch(monkeypatch, path):
+    if path == "jit" and main.njit is None:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(main, "USE_JIT", path == "jit")
+
+    finished = main.run_batch(0, 10, 20, rng=main.make_rng(0))
+
+    assert finished.shape == (0,)
+
+
+class Roadblock(main.RoadObject):
+    """An object the kernels have no implementation for."""
+
+    def affect(self, speeds, mask, rand):
+        speeds[mask] = 0
+
+
+@pytest.mark.parametrize("use_jit", [False, True])
+def test_untagged_object_falls_back_to_affect(monkeypatch, use_jit):
+    monkeypatch.setattr(main, "USE_JIT", use_jit)
+    road = main.Road(100, [main.SpeedCamera(15), Roadblock()])
+
+    finished = main.run_batch(3, 10, 30, rng=main.make_rng(0), road=road)
+
+    np.testing.assert_array_equal(finished, [0, 0, 0])
+
+
+def test_speed_bump_needs_whole_number():
+    assert main.SpeedBump(5.0).slow_down == 5
+    with pytest.raises(ValueError):
+        main.SpeedBump(2.5)
+
+
+@pytest.mark.parametrize("slow_down", [0, 3, 5, 40])
+def test_fast_path_matches_full_loop(monkeypatch, slow_down):
+    monkeypatch.setattr(main, "USE_JIT", False)
+    road = main.Road(100, [main.SpeedBump(slow_down), main.CongestionCharging(0.2)])
+    fast = main.run_batch(50, 100, 25, rng=main.make_rng(3), road=road)
+
+    monkeypatch.setattr(main.SpeedBump, "stochastic", True)
+    full = main.run_batch(50, 100, 25, rng=main.make_rng(3), road=road)
+
+    np.testing.assert_array_equal(fast, full)
+
+
+def test_kernels_agree_with_road_step():
+    cuda = pytest.importorskip("numba.cuda")
+    if not cuda.is_available():
+        pytest.skip("no GPU and NUMBA_ENABLE_CUDASIM is off")
+    rng = main.make_rng(11)
+    runs, cars = 4, 32
+    # One fumes level per run, on both sides of the charging threshold
+    fumes = np.array([[0.2], [0.5], [0.6], [0.9]])
+    road = main.Road(
+        100,
+        [
+            main.SpeedCamera(15),
+            main.SpeedBump(5),
+            main.CongestionCharging(fumes),
+            main.TrafficCollisionDetection(),
+        ],
+    )
+    table = road.object_table(runs)
+    kernel = road.kernel()
+    tags = np.ascontiguousarray(table["tag"])
+    params = np.ascontiguousarray(table["param"])
+    speeds = rng.choice(main.SPEED_VALUES, size=(runs, cars), p=main.SPEED_WEIGHTS)
+    positions = rng.integers(0, 120, size=(runs, cars)).astype(speeds.dtype)
+    states = {
+        path: (positions.copy(), speeds.copy()) for path in ("road", "kernel", "gpu")
+    }
+
+    for now in range(8):
+        rand = rng.random((runs, cars, 3), dtype=np.float32)
+
+        positions, speeds = states["road"]
+        moving = positions < road.length
+        positions[moving] += speeds[moving]
+        road.step(speeds, moving, rand)
+
+        positions, speeds = states["kernel"]
+        flips = rand[..., main.CAMERA] < 0.5
+        for run in range(runs):
+            kernel(
+                positions[run],
+                speeds[run],
+                road.length,
+                table[run],
+                rand[run, :, : main.CAMERA].T,
+                flips[run],
+            )
+
+        positions, speeds = states["gpu"]
+        main.gpu_step()[(1, 1), (main.GPU_BLOCK, main.GPU_BLOCK)](
+            positions, speeds, road.length, tags, params, rand
+        )
+
+        for path in ("kernel", "gpu"):
+            for expected, actual in zip(states["road"], states[path]):
+                np.testing.assert_array_equal(actual, expected, err_msg=path)
+
+
+def test_run_on_gpu_matches_numpy_loop(fake_cupy):
+    fumes = np.array([[0.2], [0.9], [0.6]])
+    road = main.Road(
+        40,
+        [
+            main.SpeedCamera(15),
+            main.SpeedBump(5),
+            main.CongestionCharging(fumes),
+            main.TrafficCollisionDetection(),
+        ],
+    )
+    speeds = main.make_rng(4).choice(
+        main.SPEED_VALUES, size=(3, 40), p=main.SPEED_WEIGHTS
+    )
+
+    finished = main.run_on_gpu(road, speeds, 12, main.make_rng(5))
+
+    # run_on_gpu seeds cupy with its first draw and takes every tick from there
+    seed = int(main.make_rng(5).integers(2**63))
+    rand = np.random.default_rng(seed).random((12, 3, 40, 3), dtype=np.float32)
+    positions = np.zeros_like(speeds)
+    main.advance(road, positions, speeds.copy(), 12, rand)
+    np.testing.assert_array_equal(finished, (positions >= road.length).sum(axis=1))
+
+
+@pytest.mark.parametrize("num_runs, num_cars", [(0, 10), (3, 0)])
+def test_empty_batch_on_gpu(monkeypatch, fake_cupy, num_runs, num_cars):
+    monkeypatch.setattr(main, "USE_GPU", True)
+    monkeypatch.setattr(main, "gpu_available", lambda: True)
+    # The simulator accepts an empty grid, but a real GPU rejects the launch
+    monkeypatch.setattr(main, "gpu_step", lambda: pytest.fail("kernel launched"))
+
+    finished = main.run_batch(num_runs, num_cars, 20, rng=main.make_rng(0))
+
+    np.testing.assert_array_equal(finished, np.zeros(num_runs))